@@ -1,24 +1,81 @@
 import re
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from functools import lru_cache
 from logging import Logger
-from typing import Dict, Optional, Set, Tuple
+from typing import Callable, Deque, Dict, FrozenSet, List, Optional, Pattern, Set, Tuple
 
 from fs.base import FS
-from fs.errors import DirectoryExpected
-from fs.path import basename, dirname, join, splitext
-from inflection import dasherize, parameterize, underscore
-from slugify import SLUG_OK, slugify
-
-from autoslug.utils.filesystem import match_globs, rename
+from fs.errors import DirectoryExpected, ResourceNotFound
+from fs.info import Info
+from autoslug.utils.filesystem import match_globs
 from autoslug.utils.logging import log_access_denied, log_ignored
 
+_CAMEL_BOUNDARY_RES = (
+    re.compile(r"([A-Z]+)([A-Z][a-z])"),
+    re.compile(r"([a-z\d])([A-Z])"),
+)
+_SEPARATOR_CHARS_RE = re.compile(r"[-_~.\s]+")
+_NON_SLUG_CHARS_RE = re.compile(r"[^a-z0-9\-_]")
+_CLEAN_STEM_RES = {
+    "-": re.compile(r"[a-z0-9]+(?:-[a-z0-9]+)*"),
+    "_": re.compile(r"[a-z0-9]+(?:_[a-z0-9]+)*"),
+}
 
-def _handle_affixes(
-    stem: str, prefixes: Set[str], suffixes: Set[str]
-) -> Tuple[str, str, str]:
+
+@dataclass
+class RenamePlan:
+    claimed: Set[str] = field(default_factory=set)
+    vacated: Set[str] = field(default_factory=set)
+
+
+@dataclass(frozen=True)
+class ProcessingOptions:
+    rename: Callable[[FS, str, str], bool]
+    plan: Optional[RenamePlan]
+    case_insensitive: bool
+    ignore_globs: FrozenSet[str]
+    ext_dash: Dict[str, bool]
+    ext_map: Dict[str, str]
+    prefixes: FrozenSet[str]
+    suffixes: FrozenSet[str]
+    logger: Logger
+    warn_limit: Optional[int]
+    error_limit: Optional[int]
+    max_length: Optional[int]
+    n_digits: Optional[int]
+
+
+@lru_cache(maxsize=8)
+def _affix_pattern(prefixes: FrozenSet[str], suffixes: FrozenSet[str]) -> Pattern[str]:
     prefix_pattern = "|".join(re.escape(prefix) + "+" for prefix in prefixes)
     suffix_pattern = "|".join(re.escape(suffix) + "+" for suffix in suffixes)
-    pattern = f"^({prefix_pattern})?(.+?)({suffix_pattern})?$"
-    match = re.match(pattern, stem)
+    return re.compile(f"^({prefix_pattern})?(.+?)({suffix_pattern})?$")
+
+
+def _handle_affixes(
+    stem: str, prefixes: FrozenSet[str], suffixes: FrozenSet[str]
+) -> Tuple[str, str, str]:
+    if not prefixes and not suffixes:
+        return "", stem, ""
+    if all(len(affix) == 1 for affix in prefixes | suffixes):
+        prefix = ""
+        suffix = ""
+        if stem and stem[0] in prefixes:
+            rest = stem.lstrip(stem[0])
+            if not rest:
+                return stem[:-1], stem[-1], ""
+            prefix = stem[: len(stem) - len(rest)]
+            stem = rest
+        if stem and stem[-1] in suffixes:
+            core = stem.rstrip(stem[-1])
+            if not core:
+                return prefix, stem[0], stem[1:]
+            suffix = stem[len(core) :]
+            stem = core
+        return prefix, stem, suffix
+    match = _affix_pattern(prefixes, suffixes).match(stem)
     if match:
         prefix = match.group(1) or ""
         stem = match.group(2) or ""
@@ -35,283 +92,301 @@ def _shorten_stem(stem: str, max_length: int, sep: str) -> str:
     parts = stem.split(sep)
     new_stem = parts.pop(0)
     for part in parts:
-        if len(new_stem) + len(sep) + len(part) > max_length:
+        if len(new_stem) + 1 + len(part) > max_length:
             break
         new_stem += sep + part
     return new_stem
 
 
+def _fast_slug(stem: str, sep: str) -> str:
+    for pattern in _CAMEL_BOUNDARY_RES:
+        stem = pattern.sub(r"\1_\2", stem)
+    stem = _SEPARATOR_CHARS_RE.sub(sep, stem.lower())
+    return _NON_SLUG_CHARS_RE.sub("", stem)
+
+
+def _slow_slug(stem: str, dash: bool) -> str:
+    from inflection import dasherize, parameterize, underscore
+    from slugify import SLUG_OK, slugify
+
+    stem = parameterize(slugify(s=underscore(stem), ok=SLUG_OK + ".", only_ascii=True))
+    return dasherize(stem) if dash else underscore(stem)
+
+
 def _extract_leading_digits(stem: str, sep: str, n: Optional[int]) -> Tuple[str, str]:
     if n is not None:
         parts = stem.split(sep)
-        try:
-            if parts[0].isdigit() and parts[1].isalpha():
-                number = str(min(int(parts[0]), 10**n - 1)).zfill(n)
-                return number, sep.join(parts[1:])
-        except IndexError:
-            pass
+        if len(parts) >= 2 and parts[0].isdigit() and parts[1].isalpha():
+            number = str(min(int(parts[0]), 10**n - 1)).zfill(n)
+            return number, sep.join(parts[1:])
     return "", stem
 
 
+@lru_cache(maxsize=65536)
 def _process_stem(
     stem: str,
     dash: bool,
-    prefixes: Set[str],
-    suffixes: Set[str],
+    prefixes: FrozenSet[str],
+    suffixes: FrozenSet[str],
     max_length: Optional[int],
     n_digits: Optional[int],
 ) -> str:
     prefix, stem, suffix = _handle_affixes(
         stem=stem, prefixes=prefixes, suffixes=suffixes
     )
-    stem = parameterize(
-        slugify(
-            s=underscore(stem),
-            ok=(SLUG_OK + "."),
-            only_ascii=True,
-        )
-    )
-    stem = dasherize(stem) if dash else underscore(stem)
     sep = "-" if dash else "_"
-    stem = re.sub(f"{sep}+", sep, stem).strip(sep)
+    if _CLEAN_STEM_RES[sep].fullmatch(stem) is None:
+        if stem.isascii():
+            stem = _fast_slug(stem=stem, sep=sep)
+        else:
+            stem = _slow_slug(stem=stem, dash=dash)
+        stem = sep.join(filter(None, stem.split(sep)))
     digits, stem = _extract_leading_digits(stem=stem, sep=sep, n=n_digits)
     if max_length is not None:
         if prefix is not None:
             max_length -= len(prefix)
             if len(digits) > 0:
-                max_length -= len(digits) + len(sep)
+                max_length -= len(digits) + 1
         stem = _shorten_stem(stem=stem, max_length=max_length, sep=sep)
     return prefix + (digits + sep if len(digits) > 0 else "") + stem + suffix
 
 
-def _process_ext(ext: str, mappings: Dict[str, str]) -> str:
-    try:
-        return f".{mappings[ext.strip('.')]}"
-    except KeyError:
-        return ext
+def _join(parent: str, name: str) -> str:
+    if not parent:
+        return name
+    if parent.endswith("/"):
+        return parent + name
+    return parent + "/" + name
 
 
-def _check_conflict(fs: FS, path: str, new_path: str) -> bool:
-    try:
-        if fs.getmeta()["case_insensitive"]:
-            if path.lower() == new_path.lower():
-                return False
-    except KeyError:
-        pass
-    return fs.exists(new_path)
+def _split_name(path: str) -> Tuple[str, str]:
+    idx = path.rfind("/")
+    if idx < 0:
+        return "", path
+    return path[:idx] or "/", path[idx + 1 :]
 
 
-def _process_change(
+def _split_path(path: str) -> Tuple[str, str, str]:
+    parent, name = _split_name(path)
+    if "." in name and not (name.startswith(".") and name.count(".") == 1):
+        stem, ext = name.rsplit(".", 1)
+        return parent, stem, "." + ext
+    return parent, name, ""
+
+
+def _process_ext(ext: str, mappings: Dict[str, str]) -> str:
+    mapped = mappings.get(ext.strip("."))
+    return ext if mapped is None else f".{mapped}"
+
+
+def _check_conflict(
     fs: FS,
     path: str,
     new_path: str,
-    is_git_repo: bool,
-    logger: Logger,
-    warn_limit: Optional[int],
-    error_limit: Optional[int],
+    real_target: str,
+    plan: Optional[RenamePlan],
+    case_insensitive: bool,
+) -> bool:
+    if case_insensitive and path.lower() == new_path.lower():
+        return False
+    if plan is not None:
+        return new_path in plan.claimed or (
+            fs.exists(real_target) and new_path not in plan.vacated
+        )
+    return fs.exists(new_path)
+
+
+def _process_change(
+    fs: FS, path: str, new_path: str, real: str, options: ProcessingOptions
 ) -> bool:
     change = path != new_path
     new_path_len = len(new_path)
+    logger = options.logger
+    plan = options.plan
     if change:
-        if _check_conflict(fs=fs, path=path, new_path=new_path):
-            logger.error(f"conflict preventing renaming: {path} -> {new_path}")
+        real_target = _join(_split_name(real)[0], _split_name(new_path)[1])
+        if _check_conflict(
+            fs=fs,
+            path=path,
+            new_path=new_path,
+            real_target=real_target,
+            plan=plan,
+            case_insensitive=options.case_insensitive,
+        ):
+            logger.error("conflict preventing renaming: %s -> %s", path, new_path)
+        elif plan is not None:
+            plan.claimed.add(new_path)
+            plan.vacated.add(path)
+            logger.info("renamed: %s -> %s", path, new_path)
         else:
-            if rename(fs=fs, old=path, new=new_path, is_git_repo=is_git_repo):
-                logger.info(f"renamed: {path} -> {new_path}")
+            if options.rename(fs=fs, old=path, new=new_path):
+                logger.info("renamed: %s -> %s", path, new_path)
             else:
                 log_access_denied(path=path, logger=logger)
                 return False
     else:
-        logger.debug(f"unchanged: {path}")
-    if warn_limit is not None:
-        if (new_path_len > warn_limit) and (
-            (error_limit is None) or (new_path_len <= error_limit)
+        logger.debug("unchanged: %s", path)
+    if options.warn_limit is not None:
+        if (new_path_len > options.warn_limit) and (
+            (options.error_limit is None) or (new_path_len <= options.error_limit)
         ):
-            logger.warning(f"path exceeds {warn_limit} characters: {new_path}")
-    if error_limit is not None:
-        if new_path_len > error_limit:
-            logger.error(f"path exceeds {error_limit} characters: {new_path}")
+            logger.warning(
+                "path exceeds %d characters: %s", options.warn_limit, new_path
+            )
+    if options.error_limit is not None:
+        if new_path_len > options.error_limit:
+            logger.error(
+                "path exceeds %d characters: %s", options.error_limit, new_path
+            )
             return False
     return not change
 
 
-def _process_file(
-    fs: FS,
-    path: str,
-    is_git_repo: bool,
-    ok_exts: Set[str],
-    no_dash_exts: Set[str],
-    ext_map: Dict[str, str],
-    prefixes: Set[str],
-    suffixes: Set[str],
-    logger: Logger,
-    warn_limit: Optional[int],
-    error_limit: Optional[int],
-    max_length: Optional[int],
-    n_digits: Optional[int],
-) -> bool:
-    suffix = splitext(path)[1]
-    if suffix in ok_exts:
-        stem = splitext(basename(path))[0]
-    else:
-        stem = basename(path)
+def _process_file(fs: FS, path: str, real: str, options: ProcessingOptions) -> bool:
+    parent, stem, suffix = _split_path(path)
+    dash = options.ext_dash.get(suffix)
+    if dash is None:
+        stem = stem + suffix
         suffix = ""
-    dash = suffix not in no_dash_exts
-    new_path = join(
-        dirname(path),
+        dash = options.ext_dash[""]
+    new_path = _join(
+        parent,
         _process_stem(
             stem=stem,
             dash=dash,
-            prefixes=prefixes,
-            suffixes=suffixes,
-            max_length=max_length,
-            n_digits=n_digits,
+            prefixes=options.prefixes,
+            suffixes=options.suffixes,
+            max_length=options.max_length,
+            n_digits=options.n_digits,
         )
-        + _process_ext(ext=suffix, mappings=ext_map),
+        + _process_ext(ext=suffix, mappings=options.ext_map),
     )
     return _process_change(
-        fs=fs,
-        path=path,
-        new_path=new_path,
-        is_git_repo=is_git_repo,
-        logger=logger,
-        warn_limit=warn_limit,
-        error_limit=error_limit,
+        fs=fs, path=path, new_path=new_path, real=real, options=options
     )
 
 
+_Entry = Tuple[str, str, Info, bool, bool]
+
+
 def _process_dir(
     fs: FS,
     path: str,
-    is_git_repo: bool,
-    ignore_globs: Set[str],
-    ok_exts: Set[str],
-    no_dash_exts: Set[str],
-    ext_map: Dict[str, str],
-    prefixes: Set[str],
-    suffixes: Set[str],
+    real: str,
+    options: ProcessingOptions,
     ignore_root: bool,
     no_recurse: bool,
-    logger: Logger,
-    warn_limit: Optional[int],
-    error_limit: Optional[int],
-    max_length: Optional[int],
-    n_digits: Optional[int],
-) -> bool:
+) -> Tuple[bool, List[_Entry]]:
     ok = True
     if not ignore_root:
-        new_path = join(
-            dirname(path),
+        parent, name = _split_name(path)
+        new_path = _join(
+            parent,
             _process_stem(
-                stem=basename(path),
+                stem=name,
                 dash=True,
-                prefixes=prefixes,
-                suffixes=suffixes,
-                max_length=max_length,
-                n_digits=n_digits,
+                prefixes=options.prefixes,
+                suffixes=options.suffixes,
+                max_length=options.max_length,
+                n_digits=options.n_digits,
             ),
         )
         ok = (
             _process_change(
-                fs=fs,
-                path=path,
-                new_path=new_path,
-                is_git_repo=is_git_repo,
-                logger=logger,
-                warn_limit=warn_limit,
-                error_limit=error_limit,
+                fs=fs, path=path, new_path=new_path, real=real, options=options
             )
             and ok
         )
         path = new_path
+        if options.plan is None:
+            real = new_path
     if not no_recurse:
         try:
-            for subpath in fs.scandir(path):
-                ok = (
-                    process_path(
-                        fs=fs,
-                        path=join(path, subpath.name),
-                        is_git_repo=is_git_repo,
-                        ignore_globs=ignore_globs,
-                        ok_exts=ok_exts,
-                        no_dash_exts=no_dash_exts,
-                        ext_map=ext_map,
-                        prefixes=prefixes,
-                        suffixes=suffixes,
-                        ignore_root=False,
-                        no_recurse=False,
-                        logger=logger,
-                        warn_limit=warn_limit,
-                        error_limit=error_limit,
-                        max_length=max_length,
-                        n_digits=n_digits,
-                    )
-                    and ok
-                )
+            entries = list(fs.scandir(real))
         except DirectoryExpected:
-            log_access_denied(path=path, logger=logger)
-            return False
-    else:
-        log_ignored(path=path, logger=logger)
-    return ok
+            log_access_denied(path=path, logger=options.logger)
+            return False, []
+        prefix = path if path.endswith("/") else path + "/"
+        real_prefix = real if real.endswith("/") else real + "/"
+        return ok, [
+            (prefix + subpath.name, real_prefix + subpath.name, subpath, False, False)
+            for subpath in entries
+        ]
+    log_ignored(path=path, logger=options.logger)
+    return ok, []
 
 
-def process_path(
-    fs: FS,
-    path: str,
-    is_git_repo: bool,
-    ignore_globs: Set[str],
-    ok_exts: Set[str],
-    no_dash_exts: Set[str],
-    ext_map: Dict[str, str],
-    prefixes: Set[str],
-    suffixes: Set[str],
-    ignore_root: bool,
-    no_recurse: bool,
-    logger: Logger,
-    warn_limit: Optional[int],
-    error_limit: Optional[int],
-    max_length: Optional[int],
-    n_digits: Optional[int],
-) -> bool:
-    if match_globs(fs=fs, path=path, globs=ignore_globs):
-        log_ignored(path=path, logger=logger)
-        return True
-    elif fs.isdir(path):
+def _process_entry(
+    fs: FS, entry: _Entry, options: ProcessingOptions
+) -> Tuple[bool, List[_Entry]]:
+    path, real, info, ignore_root, no_recurse = entry
+    if match_globs(
+        path=path,
+        globs=options.ignore_globs,
+        case_insensitive=options.case_insensitive,
+    ):
+        log_ignored(path=path, logger=options.logger)
+    elif info.is_dir:
         return _process_dir(
             fs=fs,
             path=path,
-            is_git_repo=is_git_repo,
-            ignore_globs=ignore_globs,
-            ok_exts=ok_exts,
-            no_dash_exts=no_dash_exts,
-            ext_map=ext_map,
-            prefixes=prefixes,
-            suffixes=suffixes,
+            real=real,
+            options=options,
             ignore_root=ignore_root,
             no_recurse=no_recurse,
-            logger=logger,
-            warn_limit=warn_limit,
-            error_limit=error_limit,
-            max_length=max_length,
-            n_digits=n_digits,
-        )
-    elif fs.isfile(path):
-        return _process_file(
-            fs=fs,
-            path=path,
-            is_git_repo=is_git_repo,
-            ok_exts=ok_exts,
-            no_dash_exts=no_dash_exts,
-            ext_map=ext_map,
-            prefixes=prefixes,
-            suffixes=suffixes,
-            logger=logger,
-            warn_limit=warn_limit,
-            error_limit=error_limit,
-            max_length=max_length,
-            n_digits=n_digits,
         )
+    elif info.is_file:
+        return _process_file(fs=fs, path=path, real=real, options=options), []
     else:
-        logger.debug(f"skipped (not a file or directory): {path}")
-        return True
+        options.logger.debug("skipped (not a file or directory): %s", path)
+    return True, []
+
+
+def _process_serial(fs: FS, entry: _Entry, options: ProcessingOptions) -> bool:
+    ok = True
+    stack: Deque[_Entry] = deque()
+    stack.append(entry)
+    while stack:
+        entry_ok, children = _process_entry(fs=fs, entry=stack.pop(), options=options)
+        ok = entry_ok and ok
+        stack.extend(reversed(children))
+    return ok
+
+
+def _process_parallel(
+    fs: FS, entry: _Entry, options: ProcessingOptions, jobs: int
+) -> bool:
+    ok = True
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        pending = {executor.submit(_process_entry, fs, entry, options)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                entry_ok, children = future.result()
+                ok = entry_ok and ok
+                pending.update(
+                    executor.submit(_process_entry, fs, child, options)
+                    for child in children
+                )
+    return ok
+
+
+def process_path(
+    fs: FS,
+    path: str,
+    options: ProcessingOptions,
+    ignore_root: bool = False,
+    no_recurse: bool = False,
+    jobs: int = 1,
+    info: Optional[Info] = None,
+) -> bool:
+    if info is None:
+        try:
+            info = fs.getinfo(path)
+        except ResourceNotFound:
+            options.logger.debug("skipped (not a file or directory): %s", path)
+            return True
+    entry = (path, path, info, ignore_root, no_recurse)
+    if jobs > 1 and info.is_dir and not no_recurse:
+        return _process_parallel(fs=fs, entry=entry, options=options, jobs=jobs)
+    return _process_serial(fs=fs, entry=entry, options=options)
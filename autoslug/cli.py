@@ -1,12 +1,10 @@
 import logging
+from functools import lru_cache
 from pathlib import Path
-from subprocess import DEVNULL, CalledProcessError, run
-from typing import Optional, Tuple
+from typing import Optional
 
-from autoslug.autoslug import process_path
 from autoslug.config.arguments import OPTIONAL, POSITIONAL
 from autoslug.config.defaults import DESCRIPTION, EXT_MAP
-from autoslug.utils.filesystem import get_filesystem
 from autoslug.utils.logging import get_logger
 from autoslug.utils.parser import parse_arguments
 
@@ -22,18 +20,15 @@ def get_log_level(level: str, quiet: bool, verbose: bool) -> int:
         return getattr(logging, "INFO")
 
 
+@lru_cache(maxsize=None)
+def _walk_for_git(path: Path) -> bool:
+    return any((parent / ".git").exists() for parent in [path, *path.parents])
+
+
 def is_git_repository(path: Path) -> Optional[bool]:
     try:
-        run(
-            ["git", "-C", path.as_posix(), "rev-parse"],
-            check=True,
-            stdout=DEVNULL,
-            stderr=DEVNULL,
-        )
-        return True
-    except CalledProcessError:
-        return False
-    except FileNotFoundError:
+        return _walk_for_git(path.resolve())
+    except OSError:
         return None
 
 
@@ -46,7 +41,7 @@ def check_git_repository(path: Path, force: bool, logger: logging.Logger) -> boo
     else:
         msg = "unable to determine whether path is within git repository"
     if not force:
-        logger.critical(f"{msg}: {path.as_posix()}")
+        logger.critical("%s: %s", msg, path.as_posix())
         logger.warning("actions might be destructive and irreversible")
         logger.info("run again with --force to override and process anyway")
         exit(1)
@@ -55,7 +50,7 @@ def check_git_repository(path: Path, force: bool, logger: logging.Logger) -> boo
 
 def assert_path(path: Path, logger: logging.Logger) -> None:
     if not path.exists():
-        logger.critical(f"specified path does not exist: {path.as_posix()}")
+        logger.critical("specified path does not exist: %s", path.as_posix())
         exit(1)
     return None
 
@@ -71,6 +66,9 @@ def main() -> None:
         description=DESCRIPTION, positional=POSITIONAL, optional=OPTIONAL
     )
 
+    from autoslug.autoslug import ProcessingOptions, RenamePlan, process_path
+    from autoslug.utils.filesystem import get_filesystem, get_rename_function
+
     logger = get_logger(
         console_level=get_log_level(
             level=args["log_level"], quiet=args["quiet"], verbose=args["verbose"]
@@ -85,33 +83,36 @@ def main() -> None:
     if args["dry_run"]:
         logger.info("beginning dry run (no changes will be made)")
 
-    fs, start, ignore_root, ok = get_filesystem(
-        path=args["path"],
-        ignore_root=args["ignore_root"],
-        dry_run=args["dry_run"],
+    fs, start, ignore_root = get_filesystem(
+        path=args["path"], ignore_root=args["ignore_root"]
+    )
+
+    ext_dash = {ext: ext not in args["no_dash_exts"] for ext in args["ok_exts"]}
+    ext_dash[""] = "" not in args["no_dash_exts"]
+
+    options = ProcessingOptions(
+        case_insensitive=fs.getmeta().get("case_insensitive", False),
+        error_limit=args["error_limit"],
+        ext_dash=ext_dash,
+        ext_map=EXT_MAP,
+        ignore_globs=args["ignore_globs"],
         logger=logger,
+        max_length=args["max_length"],
+        n_digits=args["num_digits"],
+        plan=RenamePlan() if args["dry_run"] else None,
+        prefixes=args["prefixes"],
+        rename=get_rename_function(fs=fs, is_git_repo=is_git_repo),
+        suffixes=args["suffixes"],
+        warn_limit=args["warn_limit"],
     )
 
-    ok = (
-        process_path(
-            error_limit=args["error_limit"],
-            ext_map=EXT_MAP,
-            fs=fs,
-            ignore_globs=args["ignore_globs"],
-            ignore_root=ignore_root,
-            is_git_repo=is_git_repo,
-            logger=logger,
-            max_length=args["max_length"],
-            n_digits=args["num_digits"],
-            no_dash_exts=args["no_dash_exts"],
-            no_recurse=args["no_recurse"],
-            ok_exts=args["ok_exts"],
-            path=start,
-            prefixes=args["prefixes"],
-            suffixes=args["suffixes"],
-            warn_limit=args["warn_limit"],
-        )
-        and ok
+    ok = process_path(
+        fs=fs,
+        path=start,
+        options=options,
+        ignore_root=ignore_root,
+        no_recurse=args["no_recurse"],
+        jobs=args["jobs"],
     )
 
     fs.close()
@@ -1,6 +1,6 @@
-from mimetypes import types_map
+from functools import lru_cache
 from pathlib import Path
-from typing import Set
+from typing import FrozenSet
 
 from autoslug.__version__ import __version__
 from autoslug.config.defaults import (
@@ -12,8 +12,15 @@ from autoslug.config.defaults import (
 )
 
 
-def add_mime_types(exts: Set[str]) -> Set[str]:
-    return exts.union(set(types_map.keys()))
+@lru_cache(maxsize=None)
+def _get_mime_exts() -> FrozenSet[str]:
+    from mimetypes import types_map
+
+    return frozenset(types_map.keys())
+
+
+def add_mime_types(exts: FrozenSet[str]) -> FrozenSet[str]:
+    return exts.union(_get_mime_exts())
 
 
 POSITIONAL = [
@@ -54,11 +61,11 @@ OPTIONAL = {
     },
     "ignore_globs": {
         "action": "extend",
-        "default": list(IGNORE_GLOBS),
+        "default": sorted(IGNORE_GLOBS),
         "help": "glob patterns to ignore",
         "metavar": "<glob>",
         "nargs": "*",
-        "postprocess": [set],
+        "postprocess": [frozenset],
         "type": str,
     },
     "ignore_root": {
@@ -68,6 +75,16 @@ OPTIONAL = {
             "(implied when running in current directory)"
         ),
     },
+    "jobs": {
+        "default": 1,
+        "help": (
+            "number of threads to use when traversing directories "
+            "(defaults to single-threaded processing)"
+        ),
+        "metavar": "<n>",
+        "shorthands": ["j"],
+        "type": int,
+    },
     "log_file": {
         "default": None,
         "help": (
@@ -99,14 +116,14 @@ OPTIONAL = {
     },
     "no_dash_exts": {
         "action": "extend",
-        "default": list(NO_DASH_EXTS),
+        "default": sorted(NO_DASH_EXTS),
         "help": (
             "file extensions (without periods) "
             "where underscores should be used instead of dashes"
         ),
         "metavar": "<ext>",
         "nargs": "*",
-        "postprocess": [set, lambda x: {f".{ext}" for ext in x}],
+        "postprocess": [lambda x: frozenset(f".{ext}" for ext in x)],
         "type": str,
     },
     "no_recurse": {
@@ -124,7 +141,7 @@ OPTIONAL = {
     },
     "ok_exts": {
         "action": "extend",
-        "default": list(OK_EXTS),
+        "default": sorted(OK_EXTS),
         "help": "file extensions (without periods) to recognize",
         "help_suffix": (
             "and common MIME types "
@@ -133,19 +150,18 @@ OPTIONAL = {
         "metavar": "<ext>",
         "nargs": "*",
         "postprocess": [
-            set,
-            lambda x: {f".{ext}" for ext in x},
+            lambda x: frozenset(f".{ext}" for ext in x),
             lambda x: add_mime_types(x),
         ],
         "type": str,
     },
     "prefixes": {
         "action": "extend",
-        "default": list(PREFIXES),
+        "default": sorted(PREFIXES),
         "help": "file or directory name prefixes to leave unchanged",
         "metavar": "<prefix>",
         "nargs": "*",
-        "postprocess": [set],
+        "postprocess": [frozenset],
         "type": str,
     },
     "quiet": {
@@ -158,11 +174,11 @@ OPTIONAL = {
     },
     "suffixes": {
         "action": "extend",
-        "default": list(SUFFIXES),
+        "default": sorted(SUFFIXES),
         "help": "file or directory name suffices (before extension) to leave unchanged",
         "metavar": "<suffix>",
         "nargs": "*",
-        "postprocess": [set],
+        "postprocess": [frozenset],
         "type": str,
     },
     "verbose": {
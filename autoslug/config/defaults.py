@@ -1,39 +1,49 @@
-from typing import Dict, Final, Set
+from typing import Dict, Final, FrozenSet
 
 EXT_MAP: Final[Dict[str, str]] = {
     "yml": "yaml",
 }
-IGNORE_GLOBS: Final[Set[str]] = {
-    "**/__pycache__",
-    "**/.DS_Store",
-    "**/.git",
-    "**/.ipynb_checkpoints",
-    "**/LICENSE*",
-    "**/README*",
-}
-NO_DASH_EXTS: Final[Set[str]] = {
-    "py",
-}
-OK_EXTS: Final[Set[str]] = {
-    "bat",
-    "cmd",
-    "ipynb",
-    "md",
-    "ps1",
-    "R",
-    "Rmd",
-    "rst",
-    "toml",
-    "yaml",
-    "yml",
-}
-PREFIXES: Final[Set[str]] = {
-    "_",
-    ".",
-}
-SUFFIXES: Final[Set[str]] = {
-    "_",
-}
+IGNORE_GLOBS: Final[FrozenSet[str]] = frozenset(
+    {
+        "**/__pycache__",
+        "**/.DS_Store",
+        "**/.git",
+        "**/.ipynb_checkpoints",
+        "**/LICENSE*",
+        "**/README*",
+    }
+)
+NO_DASH_EXTS: Final[FrozenSet[str]] = frozenset(
+    {
+        "py",
+    }
+)
+OK_EXTS: Final[FrozenSet[str]] = frozenset(
+    {
+        "bat",
+        "cmd",
+        "ipynb",
+        "md",
+        "ps1",
+        "R",
+        "Rmd",
+        "rst",
+        "toml",
+        "yaml",
+        "yml",
+    }
+)
+PREFIXES: Final[FrozenSet[str]] = frozenset(
+    {
+        "_",
+        ".",
+    }
+)
+SUFFIXES: Final[FrozenSet[str]] = frozenset(
+    {
+        "_",
+    }
+)
 
 DESCRIPTION: Final[str] = (
     "automatically rename files and directories to be URL-friendly"
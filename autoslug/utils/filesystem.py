@@ -1,17 +1,13 @@
 import os
-from logging import Logger
+from functools import lru_cache
 from pathlib import Path
 from subprocess import DEVNULL, CalledProcessError, run
-from typing import Tuple
+from typing import Callable, FrozenSet, Match, Optional, Tuple
 
 from fs.base import FS
 from fs.errors import DirectoryExpected, FileExpected
-from fs.glob import imatch, match
-from fs.memoryfs import MemoryFS
+from fs.glob import _translate_glob
 from fs.osfs import OSFS
-from fs.path import join
-
-from autoslug.utils.logging import log_access_denied
 
 
 def _os_rename(fs: FS, old: str, new: str) -> bool:
@@ -35,8 +31,8 @@ def _fs_rename(fs: FS, old: str, new: str) -> bool:
 
 def _git_rename(fs: FS, old: str, new: str) -> bool:
     try:
-        old_path: Path = Path(fs.getsyspath(old)).resolve()
-        new_path: Path = Path(fs.getsyspath(new)).resolve()
+        old_path: Path = Path(fs.getsyspath(old))
+        new_path: Path = Path(fs.getsyspath(new))
         run(
             ["git", "mv", old_path.name, new_path.name],
             check=True,
@@ -44,71 +40,47 @@ def _git_rename(fs: FS, old: str, new: str) -> bool:
             stdout=DEVNULL,
             stderr=DEVNULL,
         )
-    except (CalledProcessError, PermissionError):
+    except (CalledProcessError, FileNotFoundError, PermissionError):
         return _os_rename(fs, old, new)
     return True
 
 
-def rename(fs: FS, old: str, new: str, is_git_repo: bool) -> bool:
+def get_rename_function(
+    fs: FS, is_git_repo: bool
+) -> Callable[[FS, str, str], bool]:
     if is_git_repo:
-        return _git_rename(fs=fs, old=old, new=new)
-    try:
-        if fs.getmeta()["supports_rename"]:
-            return _os_rename(fs=fs, old=old, new=new)
-    except KeyError:
-        pass
-    return _fs_rename(fs=fs, old=old, new=new)
+        return _git_rename
+    if fs.getmeta().get("supports_rename", False):
+        return _os_rename
+    return _fs_rename
 
 
-def match_globs(fs: FS, path: str, globs: Tuple[str]) -> bool:
-    if fs.getmeta()["case_insensitive"]:
-        return any([imatch(glob, path) for glob in globs])
-    return any([match(glob, path) for glob in globs])
+@lru_cache(maxsize=None)
+def _glob_matchers(
+    globs: FrozenSet[str], case_insensitive: bool
+) -> Tuple[Callable[[str], Optional[Match[str]]], ...]:
+    return tuple(
+        _translate_glob(glob, case_sensitive=not case_insensitive)[2].match
+        for glob in globs
+    )
 
 
-def _copy_structure(
-    src_fs: FS, dst_fs: FS, src_path: str, dst_path: str, logger: Logger
-) -> bool:
-    ok = True
-    if src_fs.isdir(src_path):
-        dst_fs.makedirs(dst_path, recreate=True)
-        try:
-            for subpath in src_fs.scandir(src_path):
-                ok = (
-                    _copy_structure(
-                        src_fs=src_fs,
-                        dst_fs=dst_fs,
-                        src_path=join(src_path, subpath.name),
-                        dst_path=join(dst_path, subpath.name),
-                        logger=logger,
-                    )
-                    and ok
-                )
-        except DirectoryExpected:
-            log_access_denied(path=src_path, logger=logger)
-            return False
-    elif src_fs.isfile(src_path):
-        dst_fs.create(dst_path)
-    return ok
+def match_globs(path: str, globs: FrozenSet[str], case_insensitive: bool) -> bool:
+    return any(
+        matcher(path) for matcher in _glob_matchers(globs, case_insensitive)
+    )
 
 
-def get_filesystem(
-    path: Path, ignore_root: bool, dry_run: bool, logger: Logger
-) -> Tuple[FS, str, bool, bool]:
-    ok = True
-    if path.resolve().as_posix() == Path(os.getcwd()).resolve().as_posix():
+def get_filesystem(path: Path, ignore_root: bool) -> Tuple[FS, str, bool]:
+    try:
+        is_cwd = os.path.samefile(path, os.getcwd())
+    except OSError:
+        is_cwd = False
+    if is_cwd:
         ignore_root = True
         root = path.as_posix()
         start = "/"
     else:
         root = path.parent.as_posix()
         start = path.name
-    if dry_run:
-        fs = MemoryFS()
-        with OSFS(root) as osfs:
-            ok = _copy_structure(
-                src_fs=osfs, dst_fs=fs, src_path=start, dst_path=start, logger=logger
-            )
-    else:
-        fs = OSFS(root)
-    return fs, start, ignore_root, ok
+    return OSFS(root), start, ignore_root
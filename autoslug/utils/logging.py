@@ -14,6 +14,9 @@ from autoslug.config.defaults import (
     LOG_FILE_FORMAT,
 )
 
+_CONSOLE_FORMATTER = Formatter(LOG_CONSOLE_FORMAT, datefmt=LOG_DATE_FORMAT)
+_FILE_FORMATTER = Formatter(LOG_FILE_FORMAT, datefmt=LOG_DATE_FORMAT)
+
 
 def get_logger(
     name: str = "autoslug",
@@ -24,28 +27,26 @@ def get_logger(
 ) -> Logger:
     logger = getLogger(name)
     logger.setLevel(level)
+    logger.propagate = False
+    logger.handlers.clear()
     console_handler = StreamHandler()
     console_handler.setLevel(console_level)
-    console_handler.setFormatter(Formatter(LOG_CONSOLE_FORMAT, datefmt=LOG_DATE_FORMAT))
+    console_handler.setFormatter(_CONSOLE_FORMATTER)
     logger.addHandler(console_handler)
     if log_file:
         file_handler = FileHandler(log_file)
         file_handler.setLevel(file_level)
-        file_handler.setFormatter(Formatter(LOG_FILE_FORMAT, datefmt=LOG_DATE_FORMAT))
+        file_handler.setFormatter(_FILE_FORMATTER)
         logger.addHandler(file_handler)
     return logger
 
 
 def log_access_denied(path: str, logger: Logger) -> None:
-    logger.error(f"access denied: {path}")
+    logger.error("access denied: %s", path)
     return None
 
 
 def log_ignored(path: str, logger: Logger) -> None:
-    logger.debug(f"ignored: {path}")
+    logger.debug("ignored: %s", path)
     return None
 
-
-def log_ignored(path: str, logger: Logger) -> None:
-    logger.debug(f"ignored: {path}")
-    return None
@@ -1,25 +1,24 @@
 from argparse import ArgumentParser
 from typing import Any, Dict, List, Optional
 
+_PARSER: Optional[ArgumentParser] = None
+
 
 def _extend_help_text(
     message: str, defaults: List[str], suffix: Optional[str] = None
 ) -> str:
     if not defaults:
         return message
-    defaults = sorted(defaults)
-    text = message + " in addition to "
-    if len(defaults) >= 2 and suffix is not None:
-        text += '"' + '", "'.join(defaults) + '", and ' + suffix
-    elif len(defaults) > 2:
-        text += '"' + '", "'.join(defaults[:-1]) + '", and "' + defaults[-1] + '"'
-    elif len(defaults) == 2:
-        text += f'"{defaults[0]}" and "{defaults[1]}"'
-    elif suffix is not None:
-        text += '"' + defaults[0] + '" and ' + suffix
+    parts = [f'"{default}"' for default in defaults]
+    if suffix is not None:
+        parts.append(suffix)
+    if len(parts) == 1:
+        body = parts[0]
+    elif len(parts) == 2:
+        body = f"{parts[0]} and {parts[1]}"
     else:
-        text += '"' + defaults[0] + '"'
-    return text
+        body = ", ".join(parts[:-1]) + ", and " + parts[-1]
+    return message + " in addition to " + body
 
 
 def _process_positional(
@@ -77,14 +76,28 @@ def _postprocess(
     return args
 
 
+def _get_parser(
+    description: str,
+    positional: List[Dict[str, Dict[str, Any]]],
+    optional: Dict[str, Dict[str, Any]],
+) -> ArgumentParser:
+    global _PARSER
+    if _PARSER is None:
+        parser = ArgumentParser(description=description)
+        _process_positional(parser=parser, args=positional)
+        _process_optional(parser=parser, args=optional)
+        _PARSER = parser
+    return _PARSER
+
+
 def parse_arguments(
     description: str,
     positional: List[Dict[str, Dict[str, Any]]],
     optional: Dict[str, Dict[str, Any]],
 ) -> Dict[str, Any]:
-    parser = ArgumentParser(description=description)
-    _process_positional(parser=parser, args=positional)
-    _process_optional(parser=parser, args=optional)
+    parser = _get_parser(
+        description=description, positional=positional, optional=optional
+    )
     return _postprocess(
         args=vars(parser.parse_args()),
         params=(